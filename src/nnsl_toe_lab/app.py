@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from threading import Lock
+
 from fastapi import FastAPI, HTTPException
 
 from rex.sim_universe.models import ToeResult
@@ -9,7 +12,11 @@ from .solvers import rg_flow, spectral_gap
 
 app = FastAPI(title="NNSL TOE Lab", version="0.1.0")
 
-_worlds: dict[str, WorldSpec] = {}
+# Least-recently-used worlds are evicted once the store is full, so a
+# long-running lab does not grow without bound.
+_MAX_WORLDS = 10_000
+_worlds: OrderedDict[str, WorldSpec] = OrderedDict()
+_worlds_lock = Lock()
 
 
 @app.get("/health", response_model=dict)
@@ -20,25 +27,31 @@ async def health() -> dict:
 @app.post("/toe/world")
 async def create_world(spec: WorldSpec) -> dict:
     world_id = spec.world_id
-    if world_id in _worlds:
-        raise HTTPException(status_code=409, detail="world_id already exists")
-    _worlds[world_id] = spec
+    with _worlds_lock:
+        if world_id in _worlds:
+            raise HTTPException(status_code=409, detail="world_id already exists")
+        _worlds[world_id] = spec
+        if len(_worlds) > _MAX_WORLDS:
+            _worlds.popitem(last=False)
     return {"world_id": world_id}
 
 
 @app.post("/toe/query", response_model=ToeResult)
 async def run_query(query: ToeQuery) -> ToeResult:
-    if query.world_id not in _worlds:
+    with _worlds_lock:
+        world = _worlds.get(query.world_id)
+        if world is not None:
+            _worlds.move_to_end(query.world_id)
+    if world is None:
         raise HTTPException(status_code=404, detail="world not found")
 
-    world = _worlds[query.world_id]
     qvec = HashingQuantizer.encode(world, query)
     field = SemanticField.from_query(world, query, qvec)
 
     if query.witness_id.startswith("spectral_gap"):
-        result = await spectral_gap.solve(world, query, field)
+        result = spectral_gap.solve(world, query, field)
     elif query.witness_id.startswith("rg_flow"):
-        result = await rg_flow.solve(world, query, field)
+        result = rg_flow.solve(world, query, field)
     else:
         raise HTTPException(status_code=400, detail="unknown witness_id")
 
@@ -8,7 +8,7 @@ from ..semantic import SemanticField
 
 class BaseSolver(ABC):
     @abstractmethod
-    async def solve(
+    def solve(
         self, world: WorldSpec, query: ToeQuery, field: SemanticField
     ) -> ToeResult:  # pragma: no cover - interface
         raise NotImplementedError
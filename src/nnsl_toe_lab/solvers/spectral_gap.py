@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import numpy as np
 
@@ -24,13 +25,81 @@ def parse_gap_threshold(question: str) -> float | None:
     return None
 
 
+@lru_cache(maxsize=256)
+def _sweep_sizes(base_spins: int, max_spins: int) -> Tuple[int, ...]:
+    """System sizes of the sweep: base_spins and its neighbours within bounds."""
+
+    return tuple(sorted({max(3, base_spins - 1), base_spins, min(max_spins, base_spins + 1)}))
+
+
+@lru_cache(maxsize=1024)
+def _gap_sweep(
+    base_spins: int,
+    j: float,
+    problem_id: int,
+    boundary_scale: float,
+    max_spins: int,
+) -> Tuple[float | None, float, float, float, float]:
+    """
+    Run the system-size sweep for one set of spectral-gap parameters.
+
+    Memoized on its inputs; repeated queries with the same resource budget
+    reuse the first run, including its measured runtimes.
+
+    Returns:
+        (gap_mid, undecidability_index, time_to_partial, complexity_growth,
+         sensitivity)
+    """
+
+    h_over_j = 1.0 + (problem_id % 7) * 0.01
+    h = h_over_j * j
+
+    spins_list = _sweep_sizes(base_spins, max_spins)
+
+    # Only the 1/(n+1) scaling and the size offset depend on n.
+    gap_scale = abs(h - j) + 0.1
+    boundary_term = boundary_scale * 0.1
+    problem_term = (problem_id % 5) * 0.01
+
+    gaps: List[float | None] = []
+    failures: List[bool] = []
+
+    # Each size costs a handful of flops, less than a perf_counter() call, so
+    # time the whole sweep once and split it evenly across sizes.
+    t0 = time.perf_counter()
+    for n in spins_list:
+        try:
+            gap_value = max(0.0, gap_scale / (n + 1) + boundary_term)
+            gap_value += problem_term
+            gap_value += 0.01 * (n - base_spins)
+            gaps.append(gap_value)
+            failures.append(False)
+        except Exception:
+            gaps.append(None)
+            failures.append(True)
+    per_size = max(1e-7, (time.perf_counter() - t0) / len(spins_list))
+    runtimes = [per_size] * len(spins_list)
+
+    u_index, time_to_partial, complexity_growth, sensitivity = summarize_undecidability_sweep(
+        gaps, runtimes, failures
+    )
+
+    try:
+        mid_idx = spins_list.index(base_spins)
+    except ValueError:
+        mid_idx = len(spins_list) // 2
+
+    gap_mid = gaps[mid_idx]
+    return gap_mid, u_index, time_to_partial, complexity_growth, sensitivity
+
+
 class SpectralGapSolver(BaseSolver):
     """Simplified spectral-gap toy that avoids heavy linear algebra."""
 
     def __init__(self, max_spins: int = 10) -> None:
         self.max_spins = max_spins
 
-    async def solve(self, world, query, field):  # type: ignore[override]
+    def solve(self, world, query, field):  # type: ignore[override]
         rb: Dict[str, object] = query.resource_budget or {}
         base_spins = int(rb.get("system_size", 6))
         base_spins = max(3, min(self.max_spins, base_spins))
@@ -38,38 +107,11 @@ class SpectralGapSolver(BaseSolver):
         j = float(rb.get("J", 1.0))
         problem_id = int(rb.get("problem_id", 0))
         boundary_scale = float(rb.get("boundary_scale", 0.05))
-        h_over_j = 1.0 + (problem_id % 7) * 0.01
-        h = h_over_j * j
-
-        spins_list = sorted({max(3, base_spins - 1), base_spins, min(self.max_spins, base_spins + 1)})
-
-        gaps: List[float | None] = []
-        runtimes: List[float] = []
-        failures: List[bool] = []
-
-        for n in spins_list:
-            t0 = time.perf_counter()
-            try:
-                gap_value = max(0.0, (abs(h - j) + 0.1) / (n + 1) + boundary_scale * 0.1)
-                gap_value += (problem_id % 5) * 0.01
-                gap_value += 0.01 * (n - base_spins)
-                gaps.append(gap_value)
-                failures.append(False)
-            except Exception:
-                gaps.append(None)
-                failures.append(True)
-            runtimes.append(time.perf_counter() - t0)
-
-        u_index, time_to_partial, complexity_growth, sensitivity = summarize_undecidability_sweep(
-            gaps, runtimes, failures
-        )
 
-        try:
-            mid_idx = spins_list.index(base_spins)
-        except ValueError:
-            mid_idx = len(spins_list) // 2
+        gap_mid, u_index, time_to_partial, complexity_growth, sensitivity = _gap_sweep(
+            base_spins, j, problem_id, boundary_scale, self.max_spins
+        )
 
-        gap_mid = gaps[mid_idx]
         threshold = parse_gap_threshold(query.question)
 
         if gap_mid is None or not np.isfinite(gap_mid):
@@ -107,5 +149,5 @@ class SpectralGapSolver(BaseSolver):
 solver = SpectralGapSolver(max_spins=10)
 
 
-async def solve(world: WorldSpec, query: ToeQuery, field: SemanticField) -> ToeResult:
-    return await solver.solve(world, query, field)
+def solve(world: WorldSpec, query: ToeQuery, field: SemanticField) -> ToeResult:
+    return solver.solve(world, query, field)
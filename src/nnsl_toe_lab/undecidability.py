@@ -1,15 +1,7 @@
 from __future__ import annotations
 
 import math
-from statistics import mean, pstdev
-from typing import Iterable, List, Tuple
-
-
-def _safe_mean(xs: Iterable[float]) -> float:
-    values = list(xs)
-    if not values:
-        return 0.0
-    return mean(values)
+from typing import List, Tuple
 
 
 def summarize_undecidability_sweep(
@@ -39,10 +31,14 @@ def summarize_undecidability_sweep(
     complexity_growth = max(1.0, slowest / fastest)
 
     finite_values = [v for v in values if v is not None and math.isfinite(v)]
-    if len(finite_values) >= 2:
-        mean_value = _safe_mean(finite_values)
+    n_finite = len(finite_values)
+    if n_finite >= 2:
+        # Plain float sums: the statistics module's exact (Fraction-based)
+        # mean/pstdev cost far more than the handful of values warrants.
+        mean_value = sum(finite_values) / n_finite
+        var = sum((v - mean_value) * (v - mean_value) for v in finite_values) / n_finite
         denom = abs(mean_value) + 1e-9
-        sensitivity = pstdev(finite_values) / denom
+        sensitivity = math.sqrt(var) / denom
     else:
         sensitivity = 0.0
 
@@ -1,7 +1,18 @@
-"""Lightweight numpy stub for offline testing."""
+"""Lightweight numpy stub for offline testing.
+
+When a real NumPy is installed elsewhere on ``sys.path`` it replaces this
+module on import, so the solvers run on real arrays. Set
+``NNSL_USE_NUMPY_STUB=1`` to force the stub (offline test mode).
+"""
 from __future__ import annotations
 
+import builtins
+import importlib.machinery
+import importlib.util
 import math
+import os
+import sys
+import warnings
 from typing import Iterable, Sequence
 
 float64 = float
@@ -36,15 +47,9 @@ def zeros(shape, dtype=float):
 
 
 def kron(a: Sequence[Sequence[float]], b: Sequence[Sequence[float]]):
-    rows_a, cols_a = len(a), len(a[0])
-    rows_b, cols_b = len(b), len(b[0])
-    result = [[0.0 for _ in range(cols_a * cols_b)] for _ in range(rows_a * rows_b)]
-    for i in range(rows_a):
-        for j in range(cols_a):
-            for k in range(rows_b):
-                for l in range(cols_b):
-                    result[i * rows_b + k][j * cols_b + l] = a[i][j] * b[k][l]
-    return result
+    # Output row (i * rows_b + k) is a[i] (x) b[k] laid out end to end, so
+    # build each row in one pass instead of filling a zeroed matrix.
+    return [[aij * bkl for aij in a_row for bkl in b_row] for a_row in a for b_row in b]
 
 
 class _Linalg:
@@ -61,6 +66,44 @@ def sort(values: Sequence[float]):
     return sorted(values)
 
 
+def mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values)
+
+
+def std(values: Sequence[float]) -> float:
+    m = mean(values)
+    return math.sqrt(sum((x - m) ** 2 for x in values) / len(values))
+
+
+def amin(values: Sequence[float]) -> float:
+    if any(math.isnan(x) for x in values):
+        return math.nan
+    return builtins.min(values)
+
+
+def amax(values: Sequence[float]) -> float:
+    if any(math.isnan(x) for x in values):
+        return math.nan
+    return builtins.max(values)
+
+
+min = amin
+max = amax
+
+
+class errstate:
+    """No-op stand-in for ``np.errstate``."""
+
+    def __init__(self, **_: str) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
 def isfinite(value: float) -> bool:
     return math.isfinite(value)
 
@@ -79,3 +122,38 @@ def tanh(x: float) -> float:
 
 def isscalar(value):
     return isinstance(value, (int, float, complex))
+
+
+def _load_real_numpy() -> None:
+    """Swap this stub for a real NumPy found outside the ``src`` directory."""
+
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    search_path = [p for p in sys.path if os.path.abspath(p or os.curdir) != src_dir]
+    spec = importlib.machinery.PathFinder.find_spec(__name__, search_path)
+    if spec is None or spec.loader is None:
+        return
+
+    stub = sys.modules[__name__]
+    real = importlib.util.module_from_spec(spec)
+    preexisting = set(sys.modules)
+    # NumPy imports its own submodules through sys.modules["numpy"].
+    sys.modules[__name__] = real
+    try:
+        spec.loader.exec_module(real)
+    except Exception as exc:
+        # Drop the half-initialised numpy.* submodules so nothing keeps a
+        # reference to a broken NumPy alongside the stub.
+        for name in set(sys.modules) - preexisting:
+            if name.startswith(__name__ + "."):
+                del sys.modules[name]
+        sys.modules[__name__] = stub
+        warnings.warn(
+            f"Failed to import NumPy from {spec.origin} ({exc!r}); "
+            "falling back to the in-tree numpy stub.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+
+if not os.environ.get("NNSL_USE_NUMPY_STUB"):
+    _load_real_numpy()
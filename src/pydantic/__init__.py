@@ -1,6 +1,7 @@
 """Minimal pydantic stub for offline use."""
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 
@@ -10,7 +11,14 @@ class BaseModel:
             setattr(self, key, value)
 
     def model_dump(self):
-        return self.__dict__.copy()
+        # cached_property values land in __dict__ on first access; they are
+        # derived data, not fields, so leave them out like pydantic does.
+        cls = type(self)
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not isinstance(getattr(cls, key, None), cached_property)
+        }
 
     def model_dict(self):
         return self.model_dump()
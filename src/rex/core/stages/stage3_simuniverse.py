@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+import copy
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 import httpx
 import yaml
@@ -19,10 +22,37 @@ from rex.sim_universe.models import (
 )
 from rex.sim_universe.orchestrator import SimUniverseOrchestrator
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+_CONFIG_CACHE_SIZE = 32
+_config_cache: OrderedDict[Tuple[str, int, int], dict] = OrderedDict()
+
 
 def load_simuniverse_config(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """
+    Load the SimUniverse YAML config, reusing the parse while the file is
+    unchanged (same mtime and size).
+
+    Callers get a deep copy, so mutating the returned dict never leaks into
+    the cache.
+    """
+
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cfg = _config_cache.get(key)
+    if cfg is None:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = yaml.load(f, Loader=_SafeLoader)
+        _config_cache[key] = cfg
+        if len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+    else:
+        _config_cache.move_to_end(key)
+    return copy.deepcopy(cfg)
 
 
 async def _run_simuniverse_async(payload: Dict[str, Any], config_path: str) -> Dict[str, Any]:
@@ -50,39 +80,25 @@ async def _run_simuniverse_async(payload: Dict[str, Any], config_path: str) -> D
         safety_margin=float(astro_cfg_raw.get("safety_margin", 10.0)),
     )
 
+    worlds_cfg = sim_cfg.get("worlds", {})
+    resolution_cfg = worlds_cfg.get("default_resolution", {})
+    energy_cfg = worlds_cfg.get("default_energy_budget", {})
+
     world_id = "world-toy-cubitt-watson-001"
     world_spec = WorldSpec(
         world_id=world_id,
-        toe_candidate_id=sim_cfg.get("worlds", {}).get(
-            "default_toe_candidate", "toe_candidate_flamehaven"
-        ),
-        host_model=sim_cfg.get("worlds", {}).get("default_host_model", "algorithmic_host"),
+        toe_candidate_id=worlds_cfg.get("default_toe_candidate", "toe_candidate_flamehaven"),
+        host_model=worlds_cfg.get("default_host_model", "algorithmic_host"),
         physics_modules=["lattice_hamiltonian", "rg_flow"],
         resolution=ResolutionConfig(
-            lattice_spacing=sim_cfg.get("worlds", {})
-            .get("default_resolution", {})
-            .get("lattice_spacing", 0.1),
-            time_step=sim_cfg.get("worlds", {})
-            .get("default_resolution", {})
-            .get("time_step", 0.01),
-            max_steps=sim_cfg.get("worlds", {})
-            .get("default_resolution", {})
-            .get("max_steps", 1000),
+            lattice_spacing=resolution_cfg.get("lattice_spacing", 0.1),
+            time_step=resolution_cfg.get("time_step", 0.01),
+            max_steps=resolution_cfg.get("max_steps", 1000),
         ),
         energy_budget=EnergyBudgetConfig(
-            max_flops=float(
-                sim_cfg.get("worlds", {})
-                .get("default_energy_budget", {})
-                .get("max_flops", 1e30)
-            ),
-            max_wallclock_seconds=float(
-                sim_cfg.get("worlds", {})
-                .get("default_energy_budget", {})
-                .get("max_wallclock_seconds", 3600)
-            ),
-            notes=sim_cfg.get("worlds", {})
-            .get("default_energy_budget", {})
-            .get("notes", None),
+            max_flops=float(energy_cfg.get("max_flops", 1e30)),
+            max_wallclock_seconds=float(energy_cfg.get("max_wallclock_seconds", 3600)),
+            notes=energy_cfg.get("notes", None),
         ),
         notes="Toy world combining Cubitt-style spectral gap and Watson-style RG flow.",
     )
@@ -102,7 +118,6 @@ async def _run_simuniverse_async(payload: Dict[str, Any], config_path: str) -> D
             },
             solver_chain=["spectral_gap"],
         )
-        gap_result = await orchestrator.run_query(client, gap_query)
 
         rg_query = ToeQuery(
             world_id=created_world_id,
@@ -117,24 +132,30 @@ async def _run_simuniverse_async(payload: Dict[str, Any], config_path: str) -> D
             },
             solver_chain=["rg_flow"],
         )
-        rg_result = await orchestrator.run_query(client, rg_query)
+
+        # The two witnesses are independent queries against the same world.
+        gap_result, rg_result = await asyncio.gather(
+            orchestrator.run_query(client, gap_query),
+            orchestrator.run_query(client, rg_query),
+        )
 
     summary = orchestrator.summarize([gap_result, rg_result])
     summary["energy_feasibility"] = compute_energy_feasibility(
         world_spec, astro_cfg, queries=[gap_query, rg_query]
     )
 
-    payload.setdefault("sim_universe", {})
-    payload["sim_universe"]["world_spec"] = world_spec.model_dump()
-    payload["sim_universe"]["queries"] = {
-        "spectral_gap": gap_query.model_dump(),
-        "rg_flow": rg_query.model_dump(),
-    }
-    payload["sim_universe"]["results"] = {
-        "spectral_gap": gap_result.model_dump(),
-        "rg_flow": rg_result.model_dump(),
-    }
-    payload["sim_universe"]["summary"] = summary
+    payload.setdefault("sim_universe", {}).update(
+        world_spec=world_spec.model_dump(),
+        queries={
+            "spectral_gap": gap_query.model_dump(),
+            "rg_flow": rg_query.model_dump(),
+        },
+        results={
+            "spectral_gap": gap_result.model_dump(),
+            "rg_flow": rg_result.model_dump(),
+        },
+        summary=summary,
+    )
 
     return payload
 
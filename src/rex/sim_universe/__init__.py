@@ -6,21 +6,63 @@ Provides:
 - High-level orchestrator to run SimUniverse experiments via NNSL.
 """
 
-from .models import WorldSpec, ToeQuery, ToeResult
-from .corpus import SimUniverseCorpus
-from .astro_constraints import AstroConstraintConfig, compute_energy_feasibility
-from .reporting import (
-    EvidenceLink,
-    ToeScenarioScores,
-    build_heatmap_matrix,
-    build_toe_scenario_scores,
-    compute_faizal_score,
-    compute_mu_score,
-    extract_rg_observables,
-    print_heatmap_ascii,
-    print_heatmap_with_evidence_markdown,
-    format_evidence_markdown,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import WorldSpec, ToeQuery, ToeResult
+    from .corpus import SimUniverseCorpus
+    from .astro_constraints import AstroConstraintConfig, compute_energy_feasibility
+    from .reporting import (
+        EvidenceLink,
+        ToeScenarioScores,
+        build_heatmap_matrix,
+        build_toe_scenario_scores,
+        compute_faizal_score,
+        compute_mu_score,
+        extract_rg_observables,
+        print_heatmap_ascii,
+        print_heatmap_with_evidence_markdown,
+        format_evidence_markdown,
+    )
+
+# Public names are resolved on first access (PEP 562), so importing one
+# submodule such as ``rex.sim_universe.models`` does not pull in the
+# reporting stack.
+_LAZY_EXPORTS = {
+    "WorldSpec": ".models",
+    "ToeQuery": ".models",
+    "ToeResult": ".models",
+    "SimUniverseCorpus": ".corpus",
+    "AstroConstraintConfig": ".astro_constraints",
+    "compute_energy_feasibility": ".astro_constraints",
+    "EvidenceLink": ".reporting",
+    "ToeScenarioScores": ".reporting",
+    "build_heatmap_matrix": ".reporting",
+    "build_toe_scenario_scores": ".reporting",
+    "compute_faizal_score": ".reporting",
+    "compute_mu_score": ".reporting",
+    "extract_rg_observables": ".reporting",
+    "print_heatmap_ascii": ".reporting",
+    "print_heatmap_with_evidence_markdown": ".reporting",
+    "format_evidence_markdown": ".reporting",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "WorldSpec",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Iterable
 
 from pydantic import BaseModel
@@ -16,30 +17,23 @@ class AstroConstraintConfig(BaseModel):
     safety_margin: float = 10.0
 
 
-def _estimate_flops_spectral_gap(query: ToeQuery, cfg: AstroConstraintConfig) -> float:
-    """Estimate FLOPs for a spectral gap run with a small resolution sweep."""
-
-    rb: Dict[str, object] = query.resource_budget or {}
-    base_spins = int(rb.get("system_size", 6))
-    base_spins = max(3, base_spins)
+@lru_cache(maxsize=256)
+def _spectral_gap_flops(base_spins: int, cost_per_dim3: float) -> float:
+    """FLOPs for exact diagonalization over the sweep around ``base_spins``."""
 
     spins_list = {max(3, base_spins - 1), base_spins, base_spins + 1}
     total_cost = 0.0
 
     for n in spins_list:
-        dim = 2 ** n
-        cost = cfg.default_diag_cost_per_dim3 * float(dim**3)
-        total_cost += cost
+        # dim**3 with dim = 2**n is 8**n.
+        total_cost += cost_per_dim3 * float(8**n)
 
     return total_cost
 
 
-def _estimate_flops_rg_flow(query: ToeQuery, cfg: AstroConstraintConfig) -> float:
-    """Estimate FLOPs for RG flow runs with a three-depth sweep."""
-
-    rb: Dict[str, object] = query.resource_budget or {}
-    max_depth = int(rb.get("max_depth", 256))
-    max_depth = max(16, max_depth)
+@lru_cache(maxsize=256)
+def _rg_flow_flops(max_depth: int, cost_per_step: float) -> float:
+    """FLOPs for the three-depth RG sweep up to ``max_depth``."""
 
     depths = {
         max(16, max_depth // 4),
@@ -48,7 +42,27 @@ def _estimate_flops_rg_flow(query: ToeQuery, cfg: AstroConstraintConfig) -> floa
     }
 
     total_steps = sum(depths)
-    return cfg.default_rg_cost_per_step * float(total_steps)
+    return cost_per_step * float(total_steps)
+
+
+def _estimate_flops_spectral_gap(query: ToeQuery, cfg: AstroConstraintConfig) -> float:
+    """Estimate FLOPs for a spectral gap run with a small resolution sweep."""
+
+    rb: Dict[str, object] = query.resource_budget or {}
+    base_spins = int(rb.get("system_size", 6))
+    base_spins = max(3, base_spins)
+
+    return _spectral_gap_flops(base_spins, float(cfg.default_diag_cost_per_dim3))
+
+
+def _estimate_flops_rg_flow(query: ToeQuery, cfg: AstroConstraintConfig) -> float:
+    """Estimate FLOPs for RG flow runs with a three-depth sweep."""
+
+    rb: Dict[str, object] = query.resource_budget or {}
+    max_depth = int(rb.get("max_depth", 256))
+    max_depth = max(16, max_depth)
+
+    return _rg_flow_flops(max_depth, float(cfg.default_rg_cost_per_step))
 
 
 def estimate_required_flops(
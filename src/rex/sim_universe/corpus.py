@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel
@@ -84,11 +85,16 @@ class SimUniverseCorpus(BaseModel):
         ]
 
 
+    # The indices are built on first access and kept for the lifetime of the
+    # corpus; the corpus is treated as read-only once loaded.
+    @cached_property
     def paper_index(self) -> Dict[str, PaperEntry]:
         return {paper.id: paper for paper in self.papers}
 
+    @cached_property
     def claim_index(self) -> Dict[str, ClaimEntry]:
         return {claim.id: claim for claim in self.claims}
 
+    @cached_property
     def toe_index(self) -> Dict[str, ToeCandidate]:
         return {toe.id: toe for toe in self.toe_candidates}
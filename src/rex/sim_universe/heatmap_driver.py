@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import httpx
+
+from .astro_constraints import AstroConstraintConfig, compute_energy_feasibility
+from .corpus import SimUniverseCorpus
+from .models import (
+    EnergyBudgetConfig,
+    NNSLConfig,
+    ResolutionConfig,
+    ToeQuery,
+    WorldSpec,
+)
+from .orchestrator import SimUniverseOrchestrator
+from .reporting import ToeScenarioScores, build_toe_scenario_scores
+
+
+def load_corpus(path: str) -> SimUniverseCorpus:
+    # json.loads detects UTF-8 on bytes itself, so skip the explicit decode.
+    data = json.loads(Path(path).read_bytes())
+    return SimUniverseCorpus(**data)
+
+
+async def run_single_scenario(
+    client: httpx.AsyncClient,
+    nnsl_conf: NNSLConfig,
+    astro_cfg: AstroConstraintConfig,
+    corpus: SimUniverseCorpus,
+    toe_candidate_id: str,
+    world_index: int,
+    world_template: dict,
+) -> ToeScenarioScores:
+    """
+    Create one world from ``world_template``, run the spectral-gap and RG
+    witnesses against it, and score the (toe_candidate, world) scenario.
+    """
+
+    orchestrator = SimUniverseOrchestrator(nnsl_conf)
+
+    world_id = f"world-{toe_candidate_id}-{world_index:03d}"
+    world_spec = WorldSpec(
+        world_id=world_id,
+        toe_candidate_id=toe_candidate_id,
+        host_model=world_template.get("host_model", "algorithmic_host"),
+        physics_modules=world_template.get(
+            "physics_modules", ["lattice_hamiltonian", "rg_flow"]
+        ),
+        resolution=ResolutionConfig(
+            lattice_spacing=world_template["resolution"]["lattice_spacing"],
+            time_step=world_template["resolution"]["time_step"],
+            max_steps=world_template["resolution"]["max_steps"],
+        ),
+        energy_budget=EnergyBudgetConfig(
+            max_flops=world_template["energy_budget"]["max_flops"],
+            max_wallclock_seconds=world_template["energy_budget"][
+                "max_wallclock_seconds"
+            ],
+            notes=world_template["energy_budget"].get("notes"),
+        ),
+        notes=world_template.get("notes", ""),
+    )
+
+    created_world_id = await orchestrator.create_world(client, world_spec)
+
+    gap_query = ToeQuery(
+        world_id=created_world_id,
+        witness_id="spectral_gap_2d",
+        question="gap > 0.1",
+        resource_budget={
+            "system_size": world_template.get("gap_system_size", 6),
+            "J": 1.0,
+            "problem_id": world_template.get("problem_id", 0),
+            "boundary_scale": world_template.get("boundary_scale", 0.05),
+        },
+        solver_chain=["spectral_gap"],
+    )
+
+    rg_query = ToeQuery(
+        world_id=created_world_id,
+        witness_id="rg_flow_uncomputable",
+        question=world_template.get("rg_question", "phase == chaotic"),
+        resource_budget={
+            "x0": world_template.get("rg_x0", 0.2),
+            "y0": world_template.get("rg_y0", 0.3),
+            "r_base": world_template.get("rg_r_base", 3.7),
+            "program_id": world_template.get("rg_program_id", 42),
+            "max_depth": world_template.get("rg_max_depth", 256),
+        },
+        solver_chain=["rg_flow"],
+    )
+    gap_result, rg_result = await asyncio.gather(
+        orchestrator.run_query(client, gap_query),
+        orchestrator.run_query(client, rg_query),
+    )
+
+    summary = orchestrator.summarize([gap_result, rg_result])
+    energy_feasibility = compute_energy_feasibility(
+        world_spec,
+        astro_cfg,
+        queries=[gap_query, rg_query],
+    )
+
+    witness_results: Dict[str, object] = {
+        gap_query.witness_id: gap_result,
+        rg_query.witness_id: rg_result,
+    }
+
+    return build_toe_scenario_scores(
+        toe_candidate_id=toe_candidate_id,
+        world_id=world_id,
+        summary=summary,
+        energy_feasibility=energy_feasibility,
+        witness_results=witness_results,  # type: ignore[arg-type]
+        corpus=corpus,
+    )
+
+
+async def run_scenarios(
+    client: httpx.AsyncClient,
+    nnsl_conf: NNSLConfig,
+    astro_cfg: AstroConstraintConfig,
+    corpus: SimUniverseCorpus,
+    toe_candidates: Sequence[str],
+    world_templates: Sequence[dict],
+    max_concurrency: int = 8,
+) -> List[ToeScenarioScores]:
+    """
+    Run every (toe_candidate, world_template) scenario with at most
+    ``max_concurrency`` scenarios in flight against NNSL at once.
+
+    Results are returned in completion order; the heatmap builders sort by
+    TOE and world ids themselves.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(toe_id: str, world_template: dict) -> ToeScenarioScores:
+        async with semaphore:
+            return await run_single_scenario(
+                client=client,
+                nnsl_conf=nnsl_conf,
+                astro_cfg=astro_cfg,
+                corpus=corpus,
+                toe_candidate_id=toe_id,
+                world_index=world_template["index"],
+                world_template=world_template,
+            )
+
+    tasks = [
+        bounded(toe_id, world_template)
+        for toe_id in toe_candidates
+        for world_template in world_templates
+    ]
+
+    results: List[ToeScenarioScores] = []
+    for next_result in asyncio.as_completed(tasks):
+        results.append(await next_result)
+    return results
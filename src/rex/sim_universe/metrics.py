@@ -1,36 +1,51 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Dict, Iterable
 
 from .models import ToeResult
 
+_DECIDED = frozenset({"decided_true", "decided_false"})
+
+
+def compute_metrics(results: Iterable[ToeResult]) -> Dict[str, float]:
+    """
+    Compute coverage_alg, coverage_meta and mean_undecidability_index in a
+    single pass over ``results``.
+    """
+
+    count = 0
+    decided = 0
+    meta = 0
+    u_sum = 0.0
+    for r in results:
+        count += 1
+        status = r.status
+        if status in _DECIDED:
+            decided += 1
+        if status == "undecidable_theory" or r.t_oracle_called:
+            meta += 1
+        u_sum += r.undecidability_index
+
+    if not count:
+        return {
+            "coverage_alg": 0.0,
+            "coverage_meta": 0.0,
+            "mean_undecidability_index": 0.0,
+        }
+    return {
+        "coverage_alg": decided / count,
+        "coverage_meta": meta / count,
+        "mean_undecidability_index": u_sum / count,
+    }
+
 
 def coverage_alg(results: Iterable[ToeResult]) -> float:
-    results = list(results)
-    if not results:
-        return 0.0
-    ok = sum(
-        1
-        for r in results
-        if r.status in ("decided_true", "decided_false")
-    )
-    return ok / len(results)
+    return compute_metrics(results)["coverage_alg"]
 
 
 def coverage_meta(results: Iterable[ToeResult]) -> float:
-    results = list(results)
-    if not results:
-        return 0.0
-    meta = sum(
-        1
-        for r in results
-        if r.status == "undecidable_theory" or r.t_oracle_called
-    )
-    return meta / len(results)
+    return compute_metrics(results)["coverage_meta"]
 
 
 def mean_undecidability_index(results: Iterable[ToeResult]) -> float:
-    results = list(results)
-    if not results:
-        return 0.0
-    return sum(r.undecidability_index for r in results) / len(results)
+    return compute_metrics(results)["mean_undecidability_index"]
@@ -5,7 +5,7 @@ from typing import Sequence
 import httpx
 
 from .models import NNSLConfig, ToeQuery, ToeResult, WorldSpec
-from .metrics import coverage_alg, coverage_meta, mean_undecidability_index
+from .metrics import compute_metrics
 
 
 class SimUniverseOrchestrator:
@@ -35,8 +35,4 @@ class SimUniverseOrchestrator:
 
     @staticmethod
     def summarize(results: Sequence[ToeResult]) -> dict:
-        return {
-            "coverage_alg": coverage_alg(results),
-            "coverage_meta": coverage_meta(results),
-            "mean_undecidability_index": mean_undecidability_index(results),
-        }
+        return compute_metrics(results)
@@ -194,9 +194,9 @@ def collect_evidence_links(
     the corpus assumptions.
     """
 
-    toe_index = corpus.toe_index()
-    claim_index = corpus.claim_index()
-    paper_index = corpus.paper_index()
+    toe_index = corpus.toe_index
+    claim_index = corpus.claim_index
+    paper_index = corpus.paper_index
 
     toe = toe_index.get(toe_candidate_id)
     if toe is None:
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from pathlib import Path
 from trace import Trace
@@ -52,8 +51,8 @@ def _run_sim_scenario():
 
     energy_score = compute_energy_feasibility(world, cfg, queries=[q_gap, q_rg])
 
-    spectral_result = asyncio.run(solve_gap(world, q_gap, SemanticField([0.0], {})))
-    rg_result = asyncio.run(solve_rg(world, q_rg, SemanticField([0.0], {})))
+    spectral_result = solve_gap(world, q_gap, SemanticField([0.0], {}))
+    rg_result = solve_rg(world, q_rg, SemanticField([0.0], {}))
 
     summarize_undecidability_sweep([1.0, 1.2, None], [0.1, 0.2, 0.3], [False, False, True])
 
@@ -0,0 +1,46 @@
+import pytest
+
+from rex.sim_universe.metrics import (
+    compute_metrics,
+    coverage_alg,
+    coverage_meta,
+    mean_undecidability_index,
+)
+from rex.sim_universe.models import ToeResult, ToeResultMetrics
+
+
+def _result(status, u_index, oracle=False):
+    return ToeResult(
+        status=status,
+        undecidability_index=u_index,
+        t_oracle_called=oracle,
+        metrics=ToeResultMetrics(
+            time_to_partial_answer=0.0,
+            complexity_growth=1.0,
+            sensitivity_to_resolution=0.0,
+        ),
+    )
+
+
+def test_compute_metrics_single_pass_matches_individual_metrics():
+    results = [
+        _result("decided_true", 0.2),
+        _result("decided_false", 0.4, oracle=True),
+        _result("undecidable_theory", 0.9),
+        _result("undecided_resource", 0.5),
+    ]
+
+    metrics = compute_metrics(iter(results))
+
+    assert metrics["coverage_alg"] == pytest.approx(0.5) == coverage_alg(results)
+    assert metrics["coverage_meta"] == pytest.approx(0.5) == coverage_meta(results)
+    assert metrics["mean_undecidability_index"] == pytest.approx(0.5)
+    assert metrics["mean_undecidability_index"] == mean_undecidability_index(results)
+
+
+def test_compute_metrics_handles_empty():
+    assert compute_metrics([]) == {
+        "coverage_alg": 0.0,
+        "coverage_meta": 0.0,
+        "mean_undecidability_index": 0.0,
+    }
@@ -96,3 +96,14 @@ def test_reporting_scores_and_evidence():
     md_table = print_heatmap_with_evidence_markdown([scores])
     assert "toe_candidate_faizal_mtoe" in md_table
     assert "world-001" in md_table
+
+
+def test_corpus_indexes_stay_out_of_model_dump():
+    corpus = load_corpus()
+    before = corpus.model_dump()
+
+    assert corpus.toe_index and corpus.paper_index and corpus.claim_index
+
+    after = corpus.model_dump()
+    assert after.keys() == before.keys()
+    assert not {"toe_index", "paper_index", "claim_index"} & after.keys()
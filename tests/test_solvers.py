@@ -1,10 +1,17 @@
-import asyncio
+import math
 
 import numpy as np
 import pytest
 
 from nnsl_toe_lab.semantic import SemanticField
-from nnsl_toe_lab.solvers.rg_flow import solve as solve_rg
+from nnsl_toe_lab.solvers.rg_flow import (
+    _program_hash,
+    approximate_lyapunov,
+    classify_phase,
+    rg_step,
+    run_rg_flow,
+    solve as solve_rg,
+)
 from nnsl_toe_lab.solvers.spectral_gap import solve as solve_gap
 from rex.sim_universe.models import EnergyBudgetConfig, ResolutionConfig, ToeQuery, ToeResultMetrics, WorldSpec
 
@@ -30,7 +37,7 @@ def test_spectral_gap_solver_produces_gap(world_spec):
         solver_chain=["spectral_gap"],
     )
 
-    result = asyncio.run(solve_gap(world_spec, query, SemanticField([0.0], {})))
+    result = solve_gap(world_spec, query, SemanticField([0.0], {}))
 
     assert result.status in {"decided_true", "decided_false"}
     assert result.approx_value is None or np.isfinite(result.approx_value)
@@ -55,10 +62,76 @@ def test_rg_flow_solver_emits_phase_and_halting(world_spec):
         solver_chain=["rg_flow"],
     )
 
-    result = asyncio.run(solve_rg(world_spec, query, SemanticField([0.0], {})))
+    result = solve_rg(world_spec, query, SemanticField([0.0], {}))
 
     assert result.status in {"decided_true", "decided_false"}
     assert -1.1 <= (result.approx_value or 0.0) <= 1.1
     assert 0.0 <= result.metrics.rg_halting_indicator <= 1.0
     assert result.metrics.rg_phase_index is not None
     assert 0.0 <= result.undecidability_index <= 1.0
+
+
+def _baseline_classify_phase(g_traj, lyap, tol_fixed=1e-4):
+    # The pre-numpy classify_phase: a float loop over the trajectory tail.
+    if len(g_traj) < 4:
+        return "unknown"
+    g_tail = [float(g) for g in g_traj[-32:]]
+    g_mean = sum(g_tail) / len(g_tail)
+    std = math.sqrt(sum((g - g_mean) ** 2 for g in g_tail) / len(g_tail))
+    spread = max(g_tail) - min(g_tail)
+    if std < tol_fixed and lyap < 0.0:
+        return "fixed"
+    if lyap > 0.0 and spread > 0.3:
+        return "chaotic"
+    if spread > 0.1:
+        return "oscillatory"
+    return "unknown"
+
+
+def _phase_or_error(classify, g_traj, lyap):
+    try:
+        return classify(g_traj, lyap)
+    except ArithmeticError:
+        return "failed"
+
+
+@pytest.mark.parametrize("program_id", [41, 42])
+@pytest.mark.parametrize("r_base", [3.99, 4.2, 4.5])
+@pytest.mark.parametrize("x0, y0", [(0.2, 0.3), (0.6, 0.1), (0.25, 0.4)])
+def test_classify_phase_matches_baseline_on_diverging_flows(program_id, r_base, x0, y0):
+    for depth in (16, 32, 64, 256):
+        g_traj, lyap = run_rg_flow(x0, y0, program_id, r_base, depth)
+
+        assert _phase_or_error(classify_phase, g_traj, lyap) == _phase_or_error(
+            _baseline_classify_phase, g_traj, lyap
+        )
+
+
+def test_classify_phase_fails_on_overflowing_tail():
+    # The coupling is still finite at depth 16 but its square overflows.
+    g_traj, lyap = run_rg_flow(0.25, 0.4, 42, 4.2, 16)
+
+    with pytest.raises(ArithmeticError):
+        classify_phase(g_traj, lyap)
+
+
+def _same_float(a, b):
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+@pytest.mark.parametrize("program_id, r_base", [(77, 3.6), (42, 3.6), (77, 4.5), (42, 4.5)])
+def test_run_rg_flow_matches_rg_step_and_approximate_lyapunov(program_id, r_base):
+    x0, y0, depth = 0.25, 0.4, 64
+
+    couplings = np.array([x0, y0], dtype=float)
+    expected_g = [x0]
+    for _ in range(depth):
+        couplings = rg_step(couplings, program_id, r_base)
+        expected_g.append(float(couplings[0]))
+    expected_lyap = approximate_lyapunov(expected_g, r_base + 0.3 * _program_hash(program_id))
+
+    g_traj, lyap = run_rg_flow(x0, y0, program_id, r_base, depth)
+
+    assert len(g_traj) == depth + 1
+    assert all(_same_float(float(a), b) for a, b in zip(g_traj, expected_g))
+    assert _same_float(lyap, expected_lyap)
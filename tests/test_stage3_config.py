@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("httpx")
+
+from rex.core.stages import stage3_simuniverse
+from rex.core.stages.stage3_simuniverse import load_simuniverse_config
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    stage3_simuniverse._config_cache.clear()
+    yield
+    stage3_simuniverse._config_cache.clear()
+
+
+def test_load_simuniverse_config_returns_independent_copies(tmp_path):
+    path = tmp_path / "simuniverse.yaml"
+    path.write_text("sim_universe:\n  worlds:\n    - id: w1\n", encoding="utf-8")
+
+    first = load_simuniverse_config(str(path))
+    first["sim_universe"]["worlds"].append({"id": "mutated"})
+    first["extra"] = True
+
+    second = load_simuniverse_config(str(path))
+
+    assert second == {"sim_universe": {"worlds": [{"id": "w1"}]}}
+    assert len(stage3_simuniverse._config_cache) == 1
+
+
+def test_load_simuniverse_config_reparses_rewritten_file(tmp_path):
+    path = tmp_path / "simuniverse.yaml"
+    path.write_text("sim_universe:\n  depth: 1\n", encoding="utf-8")
+    assert load_simuniverse_config(str(path)) == {"sim_universe": {"depth": 1}}
+
+    path.write_text("sim_universe:\n  depth: 12345\n", encoding="utf-8")
+
+    assert load_simuniverse_config(str(path)) == {"sim_universe": {"depth": 12345}}